@@ -10,7 +10,6 @@ t_ambient = 40
 
 geometry = hct.Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5,
                         thickness_fin_t=1e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
-geometry.fin_distance_s = hct.calc_fin_distance_s(geometry)
 
 fan_name = 'orion_od4010m.csv'
 
@@ -6,9 +6,6 @@ import os
 # own libraries
 import hct
 
-for (_, _, file_name_list) in os.walk('../hct/data/'):
-    fan_list = file_name_list
-
 config = hct.OptimizationParameters(
 
     heat_sink_study_name="trial1_area_1",
@@ -20,14 +17,14 @@ config = hct.OptimizationParameters(
     height_d_list=[0.001, 0.003],
     number_fins_n_list=[5, 20],
     thickness_fin_t_list=[1e-3, 5e-3],
-    fan_list=fan_list,
+    fan_list=list(hct.FAN_LIST),
     t_ambient=40,
     area_min=0.02 * 0.1
 )
 
 hct.Optimization.start_proceed_study(config=config, number_trials=10000)
 
-hct.global_plot_settings_font_latex()
+hct.global_plot_settings_font_mathtext()
 
 df = hct.Optimization.study_to_df(config)
 hct.Optimization.df_plot_pareto_front(df, (50, 60))
@@ -4,15 +4,22 @@ Implementation of the thermal model according to a given paper.
 Christoph Gammeter, Florian Krismer, Johann Kolar:
 'Weight Optimization of a Cooling System Composed of Fan and Extruded Fin Heat Sink'
 """
+# python libraries
+import functools
+import math
+
 # 3rd party libraries
 import numpy as np
-from matplotlib import pyplot as plt
-import pandas as pd
 
 # hct libraries
 from hct.thermal_dataclasses import *
 from hct.fan_data import *
 
+# numerical constants of the model equations
+_SQRT_PI = math.sqrt(math.pi)
+_PI_HALF = math.pi / 2
+_192_OVER_PI5 = 192 / math.pi ** 5
+
 def calc_r_th_d(geometry: Geometry, constants: Constants) -> float:
     """
     Calculate the R_th,d (heatsink baseplate).
@@ -24,22 +31,24 @@ def calc_r_th_d(geometry: Geometry, constants: Constants) -> float:
     r_th_d = geometry.height_d / (geometry.width_b * geometry.length_l * constants.lambda_material)
     return r_th_d
 
-def calculate_r_th_sa_part_ii(constants: Constants, volume_flow_v_dot: float, heat_transfer_coefficient_h: float, a_eff_fin: float):
+def calculate_r_th_sa_part_ii(constants: Constants, volume_flow_v_dot: float | np.ndarray, heat_transfer_coefficient_h: float | np.ndarray,
+                              a_eff_fin: float | np.ndarray):
     """
     Calculate the heat sink conventional cooling part.
 
     :param constants: Constants
-    :param volume_flow_v_dot: volume flow in m³/s
+    :param volume_flow_v_dot: volume flow in m³/s, scalar or array
     :param heat_transfer_coefficient_h: heat transfer coefficient
     :param a_eff_fin: effective fine area
     :return: heat sink conventional cooling part.
     """
-    denominator = (constants.rho_air * constants.c_air * volume_flow_v_dot * \
-                   (1 - np.e ** (-heat_transfer_coefficient_h * a_eff_fin / constants.rho_air / constants.c_air / volume_flow_v_dot)))
+    heat_capacity_flow = constants.rho_c_air * volume_flow_v_dot
+    # -expm1(-x) = 1 - exp(-x), but without loss of precision for small x
+    denominator = heat_capacity_flow * -np.expm1(-heat_transfer_coefficient_h * a_eff_fin / heat_capacity_flow)
     r_th_sa_part_ii = 1 / denominator
     return r_th_sa_part_ii
 
-def calc_effective_fin_surface(eta_fin: float, geometry: Geometry) -> float:
+def calc_effective_fin_surface(eta_fin: float | np.ndarray, geometry: Geometry) -> float | np.ndarray:
     """
     Calculate the effective fin area.
 
@@ -50,7 +59,7 @@ def calc_effective_fin_surface(eta_fin: float, geometry: Geometry) -> float:
     a_eff_fin = geometry.number_fins_n * (2 * geometry.height_c * eta_fin + geometry.fin_distance_s) * geometry.length_l
     return a_eff_fin
 
-def calc_fin_efficiency(geometry: Geometry, constants: Constants, heat_transfer_coefficient_h: float) -> float:
+def calc_fin_efficiency(geometry: Geometry, constants: Constants, heat_transfer_coefficient_h: float | np.ndarray) -> float | np.ndarray:
     """
     Calculate the fin efficiency factor.
 
@@ -59,14 +68,12 @@ def calc_fin_efficiency(geometry: Geometry, constants: Constants, heat_transfer_
     :param constants: material parameters
     :type constants: Constants
     :param heat_transfer_coefficient_h: heat transfer coefficient
-    :type heat_transfer_coefficient_h: float
+    :type heat_transfer_coefficient_h: float | np.ndarray
     :return: fin efficiency
     """
-    nominator = np.tanh(np.sqrt(heat_transfer_coefficient_h * 2 * (geometry.thickness_fin_t + geometry.length_l) / \
-                                (constants.lambda_material * geometry.thickness_fin_t * geometry.length_l)) * geometry.height_c)
-    denominator = np.sqrt(heat_transfer_coefficient_h * 2 * (geometry.thickness_fin_t + geometry.length_l) / \
-                          (constants.lambda_material * geometry.thickness_fin_t * geometry.length_l)) * geometry.height_c
-    fin_efficiency = nominator / denominator
+    fin_parameter = np.sqrt(heat_transfer_coefficient_h * 2 * (geometry.thickness_fin_t + geometry.length_l) / \
+                            (constants.lambda_material * geometry.thickness_fin_t * geometry.length_l)) * geometry.height_c
+    fin_efficiency = np.tanh(fin_parameter) / fin_parameter
     return fin_efficiency
 
 def calc_fin_distance_s(geometry: Geometry) -> float:
@@ -89,7 +96,7 @@ def calc_d_h(geometry: Geometry) -> float:
     d_h = 2 * geometry.fin_distance_s * geometry.height_c / (geometry.fin_distance_s + geometry.height_c)
     return d_h
 
-def calc_heat_transfer_coefficient_h(nu_sqrt_a: float, constants: Constants, d_h: float) -> float:
+def calc_heat_transfer_coefficient_h(nu_sqrt_a: float | np.ndarray, constants: Constants, d_h: float) -> float | np.ndarray:
     """
     Calculate the heat transfer coefficient h.
 
@@ -116,10 +123,17 @@ def init_constants() -> Constants:
                      lambda_material=210, rho_material=2699, k_venturi=0.2)
 
 
+# Constants is frozen, so one instance is shared by all calculations instead of calling init_constants() each time
+CONSTANTS = init_constants()
+
+
+@functools.lru_cache
 def calc_blending_m(prandtl_number: float) -> float:
     """
     Calculate the blending parameter m from the given Prandtl number.
 
+    The result is cached, as the Prandtl number only depends on the ambient temperature.
+
     :param prandtl_number: Prandtl number
     :return: blending parameter m
     """
@@ -136,32 +150,29 @@ def calc_epsilon(geometry: Geometry) -> float:
     :param geometry: heat sink geometry.
     :return: epsilon shape factor from the fin geometry.
     """
-    if geometry.fin_distance_s < geometry.height_c:
-        epsilon = geometry.fin_distance_s / geometry.height_c
-    else:
-        epsilon = geometry.height_c / geometry.fin_distance_s
+    epsilon = np.minimum(geometry.fin_distance_s, geometry.height_c) / np.maximum(geometry.fin_distance_s, geometry.height_c)
     return epsilon
 
-def calc_hs_shape_z_star(geometry: Geometry, constants: Constants, prandtl_number: float, volume_flow_v_dot: float):
+def calc_hs_shape_z_star(geometry: Geometry, constants: Constants, prandtl_number: float, volume_flow_v_dot: float | np.ndarray):
     """
     Calculate the heat sink shape factor called z_star for extruded heat sinks. This factor has no dimension.
 
     :param geometry: Geometry
     :param constants: Constants
     :param prandtl_number: Prandtl number
-    :param volume_flow_v_dot: volume flow in m³/s
+    :param volume_flow_v_dot: volume flow in m³/s, scalar or array
     :return: dimensionless heat sink shape factor
     """
-    if calc_epsilon(geometry) > 1:
-        raise Exception("Formular is not valid for this type of shape.")
-
     hs_shape_z_star = geometry.length_l * geometry.number_fins_n * constants.fluid_viscosity_air / (prandtl_number * volume_flow_v_dot)
     return hs_shape_z_star
 
+@functools.lru_cache
 def calc_prandtl_number_air(temperature_degree: float) -> float:
     """
     Calculate the Prandtl number for air at a given volume flow.
 
+    The result is cached, as the ambient temperature is the same for all calls of a volume flow sweep or an optimization.
+
     :param temperature_degree: Temperature in degree.
     :return: Prandtl number
     """
@@ -175,10 +186,13 @@ def calc_prandtl_number_air(temperature_degree: float) -> float:
     return prandtl_number
 
 
+@functools.lru_cache
 def calc_function_of_prandtl_for_uwt(prandtl_number: float):
     """
     Calculate the boundary condition for uniform wall temperature (UWT).
 
+    The result is cached, as the Prandtl number only depends on the ambient temperature.
+
     :param prandtl_number: Prandtl number
     :type prandtl_number: float
     :return: UWT boundary condition
@@ -188,8 +202,8 @@ def calc_function_of_prandtl_for_uwt(prandtl_number: float):
     return uwt_boundary_condition
 
 
-def calc_nu_sqrt_a(constants: Constants, function_of_prandtl: float, blending_m: float, hs_shape_z_star: float,
-                   friction_factor_reynolds_product: float, epsilon: float) -> float:
+def calc_nu_sqrt_a(constants: Constants, function_of_prandtl: float, blending_m: float, hs_shape_z_star: float | np.ndarray,
+                   friction_factor_reynolds_product: float | np.ndarray, epsilon: float) -> float | np.ndarray:
     """
     Calculate the nusselt number.
 
@@ -201,19 +215,25 @@ def calc_nu_sqrt_a(constants: Constants, function_of_prandtl: float, blending_m:
     :param epsilon: geometry factor epsilon
     :return: nu_sqrt_a
     """
-    term_1 = (constants.c_4 * function_of_prandtl / np.sqrt(hs_shape_z_star)) ** blending_m
-    term_2 = (constants.c_1 * friction_factor_reynolds_product / (8 * np.sqrt(np.pi) * epsilon ** constants.gamma)) ** 5
-    term_3 = (constants.c_2 * constants.c_3 * (friction_factor_reynolds_product / hs_shape_z_star) ** (1/3)) ** 5
+    # coefficients independent of the volume flow, evaluated once in case of a volume flow array
+    coefficient_1 = constants.c_4 * function_of_prandtl
+    coefficient_2 = constants.c_1 / (8 * _SQRT_PI * epsilon ** constants.gamma)
+    coefficient_3 = constants.c_2 * constants.c_3
+
+    term_1 = (coefficient_1 / np.sqrt(hs_shape_z_star)) ** blending_m
+    term_2 = (coefficient_2 * friction_factor_reynolds_product) ** 5
+    term_3 = (coefficient_3 * (friction_factor_reynolds_product / hs_shape_z_star) ** (1/3)) ** 5
     sub_term = (term_2 + term_3) ** (blending_m / 5)
     nu_sqrt_a = (term_1 + sub_term) ** (1 / blending_m)
     return nu_sqrt_a
 
-def calc_friction_factor_reynolds_product(geometry: Geometry, volume_flow_v_dot: float, constants: Constants, friction_factor_reynolds_product_fd: float):
+def calc_friction_factor_reynolds_product(geometry: Geometry, volume_flow_v_dot: float | np.ndarray, constants: Constants,
+                                          friction_factor_reynolds_product_fd: float):
     """
     Calculate the friction factor reynolds product.
 
     :param geometry: Geometry
-    :param volume_flow_v_dot: Volume flow in m³/s
+    :param volume_flow_v_dot: Volume flow in m³/s, scalar or array
     :param constants: Constants
     :param friction_factor_reynolds_product_fd:
     :return:
@@ -229,7 +249,7 @@ def calc_friction_factor_reynolds_product_fd(epsilon: float):
     :param epsilon: geometry parameter epsilon.
     :return: calc_friction_factor_reynolds_product_fd
     """
-    denominator = np.sqrt(epsilon) * (1 + epsilon) * (1 - 192/(np.pi ** 5) * epsilon * np.tanh(np.pi / 2 / epsilon))
+    denominator = np.sqrt(epsilon) * (1 + epsilon) * (1 - _192_OVER_PI5 * epsilon * np.tanh(_PI_HALF / epsilon))
     friction_factor_reynolds_product_fd = 12 / denominator
     return friction_factor_reynolds_product_fd
 
@@ -254,32 +274,22 @@ def calc_hydrodynamic_entry_length_laminar_lhplus(epsilon: float):
     :param epsilon: epsilon geometry factor
     :return: dimensionless hydrodynamic entry length for laminar flow
     """
-    hydrodynamic_entry_length_laminar_lhplus = 0.0822 * epsilon * (1 + epsilon) ** 2 * (1 - 192 * epsilon / (np.pi ** 5) * np.tanh(np.pi / 2 / epsilon))
+    hydrodynamic_entry_length_laminar_lhplus = 0.0822 * epsilon * (1 + epsilon) ** 2 * (1 - _192_OVER_PI5 * epsilon * np.tanh(_PI_HALF / epsilon))
     return hydrodynamic_entry_length_laminar_lhplus
 
-def check_friction_factor_reynolds_number_product() -> None:
-    """
-    Plot the friction factor reynolds number product with the paper.
-
-    'Laminar Forced Convection Heat Transfer in the Combined Entry Region of Nun-Circular Ducts'
-    """
-    epsilon = np.linspace(0, 1, 200)
-    friction_factor_reynolds_product = calc_friction_factor_reynolds_product_fd(epsilon)
-    plt.semilogy(epsilon, friction_factor_reynolds_product)
-    plt.grid(which='both')
-    plt.xlabel('aspect ratio epsilon')
-    plt.ylabel('friction factor reynolds product')
-    plt.show()
-
-def calc_final_r_th_s_a(geometry: Geometry, constants: Constants, t_ambient: float, volume_flow_v_dot: float):
+def calc_final_r_th_s_a(geometry: Geometry, constants: Constants, t_ambient: float, volume_flow_v_dot: float | np.ndarray):
     """
     Calculate the final r_th from sink to ambient for a given geometry nand volume flow.
 
+    The volume flow can be given as an array, e.g. for a volume flow sweep. In this case, all calculations are
+    performed elementwise and an array of the same shape is returned. The same holds for a geometry with array
+    parameters, e.g. to calculate several geometries at once.
+
     :param geometry: Geometry
     :param constants: Constants
     :param t_ambient: Ambient temperature in degree Celsius
-    :param volume_flow_v_dot: Volume flow in m³/s
-    :return: r_th_sa in K/W
+    :param volume_flow_v_dot: Volume flow in m³/s, scalar or array
+    :return: r_th_sa in K/W, scalar or array
     """
     # calculate r_th of the base plate
     r_th_d = calc_r_th_d(geometry, constants)
@@ -337,8 +347,8 @@ def calc_fan_volume(fan_name: str):
     :param fan_name: with or without '.csv', e.g. 'orion_od4010h' or 'orion_od4010h.csv'
     :return: fan volume in m³
     """
-    fan_data = fan_database[fan_name.replace('.csv', '')]
-    fan_volume = fan_data.width_height ** 2 * fan_data.length
+    index = fan_index[fan_name.replace('.csv', '')]
+    fan_volume = fan_width_height_array[index] ** 2 * fan_length_array[index]
     return fan_volume
 
 def calc_duct_volume(geometry: Geometry, fan_name: str):
@@ -349,26 +359,40 @@ def calc_duct_volume(geometry: Geometry, fan_name: str):
     In case of a too small duct, the minimum duct length is taken.
     :param geometry: Geometry
     :param fan_name: with or without '.csv', e.g. 'orion_od4010h' or 'orion_od4010h.csv'
-    :return: duct volume in m³
+    :return: duct volume in m³, scalar or array. nan (element-wise) in case of a fan smaller than the heat sink cross-section.
     """
-    fan_data = fan_database[fan_name.replace('.csv', '')]
+    fan_width_height = fan_width_height_array[fan_index[fan_name.replace('.csv', '')]]
 
-    distance_fan = (fan_data.width_height / 2) / np.tan(geometry.alpha_rad / 2)
-    if geometry.width_b < geometry.height_c:
-        min_width_height_heat_sink = geometry.width_b
-    else:
-        min_width_height_heat_sink = geometry.height_c
+    distance_fan = (fan_width_height / 2) / np.tan(geometry.alpha_rad / 2)
+    min_width_height_heat_sink = np.minimum(geometry.width_b, geometry.height_c)
     distance_heat_sink = (min_width_height_heat_sink / 2) / np.tan(geometry.alpha_rad / 2)
 
     l_duct = distance_fan - distance_heat_sink
 
-    if l_duct < 0:
-        raise ValueError("Fan too small.")
-    elif l_duct < geometry.l_duct_min:
-        l_duct = geometry.l_duct_min
+    l_duct = np.where(l_duct < 0, np.nan, np.maximum(l_duct, geometry.l_duct_min))
+
+    duct_volume = (fan_width_height + geometry.width_b) / 2 * (fan_width_height + geometry.height_c) / 2 * l_duct
+    return duct_volume[()]
 
-    duct_volume = (fan_data.width_height + geometry.width_b) / 2 * (fan_data.width_height + geometry.height_c) / 2 * l_duct
-    return duct_volume
+
+def is_geometry_feasible(geometry: Geometry, fan_name: str) -> bool:
+    """
+    Check the cheap geometry constraints of the cooling system model before running the full calculation.
+
+    A geometry is feasible, if
+     - the fins do not overlap, so the fin distance s is positive,
+     - the heat sink is not higher than wide, otherwise the air duct length becomes negative,
+     - the fan is not smaller than the heat sink cross-section, otherwise the duct length becomes negative.
+
+    The fin distance s is taken from the geometry, as it is used by the model calculation.
+
+    :param geometry: Geometry, scalar or array geometry
+    :param fan_name: with or without '.csv', e.g. 'orion_od4010h' or 'orion_od4010h.csv'
+    :return: True in case of a feasible geometry, False otherwise. For array geometries, True only if all geometries are feasible.
+    """
+    fan_width_height = fan_width_height_array[fan_index[fan_name.replace('.csv', '')]]
+
+    return bool(np.all((geometry.fin_distance_s > 0) & (geometry.width_b >= geometry.height_c) & (fan_width_height >= geometry.height_c)))
 
 
 def calc_total_volume(geometry: Geometry, fan_name: str):
@@ -400,32 +424,3 @@ def calc_weight_heat_sink(geometry: Geometry, constants: Constants) -> float:
     material_volume = boxed_volume - air_volume
     materiaL_weight = material_volume * constants.rho_material
     return materiaL_weight
-
-
-if __name__ == "__main__":
-    constants = init_constants()
-    geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5,
-                        thickness_fin_t=1e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
-    geometry.fin_distance_s = calc_fin_distance_s(geometry)
-    print(geometry)
-
-    # plot parameter
-    volume_flow_v_dot_list = np.linspace(1e-3, 15e-3)
-
-    result_list_r_th_sa = []
-
-    for volume_flow_v_dot in volume_flow_v_dot_list:
-        r_th_sa = calc_final_r_th_s_a(geometry=geometry, constants=constants, t_ambient=25, volume_flow_v_dot=volume_flow_v_dot)
-
-        result_list_r_th_sa.append(r_th_sa)
-
-    paper_comparison = pd.read_csv('paper_r_th_model.csv', delimiter=';', decimal=',')
-    paper_comparison = paper_comparison.to_numpy()
-    print(paper_comparison)
-    plt.plot(paper_comparison[:, 0], paper_comparison[:, 1], label='paper')
-    plt.plot(volume_flow_v_dot_list, result_list_r_th_sa, label='calculation')
-    plt.xlabel('Volume flow')
-    plt.ylabel('R_th,sa (K/W)')
-    plt.legend()
-    plt.grid()
-    plt.show()
@@ -0,0 +1,170 @@
+"""
+Diagnostic and verification plots for the cooling system models.
+
+This module is not imported by 'import hct' to keep matplotlib out of the package import. Use it explicitly, e.g.
+'from hct.diagnostics import *'.
+"""
+# python libraries
+import os
+
+# 3rd party libraries
+import numpy as np
+from matplotlib import pyplot as plt
+
+# hct libraries
+from hct.thermal_dataclasses import *
+from hct.cooling_system import *
+from hct.hydrodynamic import *
+from hct.heat_spreading import *
+
+
+def check_friction_factor_reynolds_number_product() -> None:
+    """
+    Plot the friction factor reynolds number product with the paper.
+
+    'Laminar Forced Convection Heat Transfer in the Combined Entry Region of Nun-Circular Ducts'
+    """
+    epsilon = np.linspace(0, 1, 200)
+    friction_factor_reynolds_product = calc_friction_factor_reynolds_product_fd(epsilon)
+    plt.semilogy(epsilon, friction_factor_reynolds_product)
+    plt.grid(which='both')
+    plt.xlabel('aspect ratio epsilon')
+    plt.ylabel('friction factor reynolds product')
+    plt.show()
+
+
+def verify_r_th_with_paper(paper_filepath: str | None = 'paper_r_th_model.csv', ax: plt.Axes | None = None) -> None:
+    """
+    Verify the r_th calculation with the R_th,sa curve from the paper.
+
+    :param paper_filepath: filepath to the .csv-file containing the R_th,sa curve of the paper. None to plot the calculation only.
+    :type paper_filepath: str | None
+    :param ax: axes to plot into, e.g. a subplot of a combined figure. If None, a new figure is created and shown.
+    :type ax: matplotlib.axes.Axes | None
+    """
+    constants = init_constants()
+    geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5,
+                        thickness_fin_t=1e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+    print(geometry)
+
+    # plot parameter, log-spaced to resolve the steep part of the curve at low volume flow
+    volume_flow_v_dot_list = np.geomspace(1e-3, 15e-3, 25)
+
+    result_list_r_th_sa = calc_final_r_th_s_a(geometry=geometry, constants=constants, t_ambient=25, volume_flow_v_dot=volume_flow_v_dot_list)
+
+    show_plot = ax is None
+    if show_plot:
+        _, ax = plt.subplots()
+    if paper_filepath is not None:
+        # first line is the header, decimal separator is ','
+        paper_comparison = np.loadtxt(paper_filepath, delimiter=';', skiprows=1, converters=lambda value: float(value.replace(',', '.')))
+        ax.plot(paper_comparison[:, 0], paper_comparison[:, 1], label='paper')
+    ax.plot(volume_flow_v_dot_list, result_list_r_th_sa, label='calculation')
+    ax.set_xlabel('Volume flow')
+    ax.set_ylabel('R_th,sa (K/W)')
+    ax.legend()
+    ax.grid()
+    if show_plot:
+        plt.show()
+
+
+def compare_fan_data(ax: plt.Axes | None = None) -> None:
+    """
+    Plot all available fan data for comparison.
+
+    :param ax: axes to plot into, e.g. a subplot of a combined figure. If None, a new figure is created and shown.
+    :type ax: matplotlib.axes.Axes | None
+    """
+    show_plot = ax is None
+    if show_plot:
+        _, ax = plt.subplots()
+    for file_name in FAN_LIST:
+        fan_cubic_meter_second, fan_pressure_drop_pascal = read_fan_data_cached(file_name)
+        ax.plot(fan_cubic_meter_second, fan_pressure_drop_pascal, label=f'{file_name}')
+    ax.set_xlabel('cubic meter per second')
+    ax.set_ylabel('pressure drop in pascal')
+    ax.grid()
+    ax.legend()
+    if show_plot:
+        plt.show()
+
+
+def plot_volume_flow_all_fans(geometry: Geometry) -> None:
+    """
+    Plot the operating point of the given geometry for all available fans.
+
+    :param geometry: Geometry
+    :type geometry: Geometry
+    """
+    # one figure with a subplot per fan, instead of a new figure for each fan
+    number_columns = int(np.ceil(np.sqrt(len(FAN_LIST))))
+    number_rows = int(np.ceil(len(FAN_LIST) / number_columns))
+    fig, axs = plt.subplots(number_rows, number_columns, squeeze=False, figsize=(4 * number_columns, 3 * number_rows))
+    for ax, fan_name in zip(axs.flat, FAN_LIST):
+        calc_volume_flow(fan_name, geometry, ax=ax)
+        ax.set_title(fan_name.replace('.csv', ''))
+    for ax in axs.flat[len(FAN_LIST):]:
+        ax.set_visible(False)
+    fig.tight_layout()
+    plt.show()
+
+
+def verify_with_phd_thesis_gammeter(ax: plt.Axes | None = None) -> None:
+    """
+    Verify with figure 3.18 (page 149), Ph.D. thesis Gammeter.
+
+    :param ax: axes to plot into, e.g. a subplot of a combined figure. If None, a new figure is created and shown.
+    :type ax: matplotlib.axes.Axes | None
+    """
+    r_th_zero = 1
+    thickness_list = np.linspace(0.1e-3, 1.0e-3)
+
+    mosfet_area = 4.04e-3 * 6.44e-3
+    spreading_material = SpreadingMaterial(heat_source_area_a_s=mosfet_area, spreading_material_area_a_sp=2 * mosfet_area, lambda_conductivity=400,
+                                           thickness_d=thickness_list)
+
+    r_th_sp_list = calc_r_th_sp(spreading_material, r_th_zero)
+
+    show_plot = ax is None
+    if show_plot:
+        _, ax = plt.subplots()
+    ax.plot(thickness_list, r_th_sp_list, label='r_th_sp')
+    ax.set_xlabel("thickness in mm")
+    ax.set_ylabel('R_th in K/W')
+    ax.grid()
+    ax.legend()
+    if show_plot:
+        plt.show()
+
+
+def plot_all_verifications(paper_filepath: str = 'paper_r_th_model.csv') -> None:
+    """
+    Plot the fan data, the R_th,sa paper comparison and the Gammeter comparison side by side in one figure.
+
+    The paper .csv-file is not part of the repository. If it is not found, the R_th,sa panel shows the calculation only.
+
+    :param paper_filepath: filepath to the .csv-file containing the R_th,sa curve of the paper
+    :type paper_filepath: str
+    """
+    fig, axs = plt.subplots(1, 3, figsize=(240 / 25.4, 60 / 25.4))
+    compare_fan_data(ax=axs[0])
+    # the legend of all fans does not fit into the small panel, use compare_fan_data() for the labelled plot
+    axs[0].get_legend().remove()
+    if os.path.isfile(paper_filepath):
+        verify_r_th_with_paper(paper_filepath, ax=axs[1])
+    else:
+        verify_r_th_with_paper(None, ax=axs[1])
+        axs[1].set_title(f'{os.path.basename(paper_filepath)} not found', fontsize='small')
+    verify_with_phd_thesis_gammeter(ax=axs[2])
+    fig.tight_layout()
+    plt.show()
+
+
+if __name__ == '__main__':
+    # global_plot_settings_font_latex()
+
+    verification_geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5, thickness_fin_t=1e-3,
+                                     fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+    plot_volume_flow_all_fans(verification_geometry)
+
+    plot_all_verifications()
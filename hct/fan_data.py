@@ -1,4 +1,8 @@
 """Fan data."""
+# 3rd party libraries
+import numpy as np
+
+# hct libraries
 from hct.thermal_dataclasses import *
 
 datasheet_3010 = 'https://www.mouser.de/datasheet/2/1491/OD3010-3239706.pdf'
@@ -92,3 +96,9 @@ fan_database = {
     "orion_od6038xch": FanData("orion", "od6038xch", width_height=60e-3, length=38e-3, weight=weight_6038xc, datasheet=datasheet_6038xc),
     "orion_od6038xcl": FanData("orion", "od6038xcl", width_height=60e-3, length=38e-3, weight=weight_6038xc, datasheet=datasheet_6038xc),
 }
+
+# struct-of-arrays representation of the fan database, e.g. fan_width_height_array[fan_index["orion_od4010h"]]
+fan_index = {fan_name: index for index, fan_name in enumerate(fan_database)}
+fan_width_height_array = np.array([fan.width_height for fan in fan_database.values()])
+fan_length_array = np.array([fan.length for fan in fan_database.values()])
+fan_weight_array = np.array([fan.weight for fan in fan_database.values()])
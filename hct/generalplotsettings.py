@@ -1,8 +1,31 @@
-"""Plot settings: Normal font or LaTeX font."""
-from matplotlib import pyplot as plt
+"""
+Plot settings: Normal font or LaTeX font.
+
+matplotlib is imported inside the functions, so 'import hct' does not load matplotlib and its GUI backend.
+"""
+# python libraries
+import types
+
+# GNOME color scheme (Color 4) as RGB values 0...255, see colors()
+_RGB_COLORS = {
+    "blue": (28, 113, 216),
+    "red": (192, 28, 40),
+    "green": (46, 194, 126),
+    "orange": (230, 97, 0),
+    "purple": (129, 61, 156),
+    "brown": (134, 94, 60),
+    "grey": (119, 118, 123),
+    "yellow": (245, 194, 17),
+    "black": (0, 0, 0),
+    "white": (255, 255, 255)
+}
+_COLORS = types.MappingProxyType({name: tuple(ti / 255 for ti in rgb) for name, rgb in _RGB_COLORS.items()})
+
 
 def global_plot_settings_font_latex() -> None:
     """Set the plot fonts to LaTeX-font."""
+    from matplotlib import pyplot as plt
+
     plt.rcParams.update({
         "text.usetex": True,
         "font.family": "serif",
@@ -12,11 +35,30 @@ def global_plot_settings_font_latex() -> None:
 
 def global_plot_settings_font_sansserif() -> None:
     """Set the plot fonts to Sans-Serif-Font."""
+    from matplotlib import pyplot as plt
+
     plt.rcParams.update({
         "text.usetex": True,
         "font.family": "sans-serif",
         "font.sans-serif": ["Helvetica"]})
 
+
+def global_plot_settings_font_mathtext() -> None:
+    """
+    Set the plot fonts to a serif font, rendering math with matplotlib's mathtext instead of LaTeX.
+
+    No external LaTeX installation is needed and drawing is much faster than with global_plot_settings_font_latex().
+    Use the LaTeX variant for final publication plots.
+    """
+    from matplotlib import pyplot as plt
+
+    plt.rcParams.update({
+        "text.usetex": False,
+        "font.family": "serif",
+        "mathtext.fontset": "cm",
+    })
+
+
 def global_plot_settings_font_size(font_size: float) -> None:
     """
     Change the plot font size.
@@ -24,23 +66,12 @@ def global_plot_settings_font_size(font_size: float) -> None:
     :param font_size: font size
     :type font_size: float
     """
+    from matplotlib import pyplot as plt
+
     font = {'size': font_size}
     plt.rc('font', **font)
 
 
-def colors() -> dict:
-    """Colors according to the GNOME color scheme (Color 4)."""
-    nominator = 255
-    color_dict = {
-        "blue": tuple(ti / nominator for ti in (28, 113, 216)),
-        'red': tuple(ti / nominator for ti in (192, 28, 40)),
-        "green": tuple(ti / nominator for ti in (46, 194, 126)),
-        "orange": tuple(ti / nominator for ti in (230, 97, 0)),
-        "purple": tuple(ti / nominator for ti in (129, 61, 156)),
-        "brown": tuple(ti / nominator for ti in (134, 94, 60)),
-        "grey": tuple(ti / nominator for ti in (119, 118, 123)),
-        "yellow": tuple(ti / nominator for ti in (245, 194, 17)),
-        "black": tuple(ti / nominator for ti in (0, 0, 0)),
-        "white": tuple(ti / nominator for ti in (255, 255, 255))
-    }
-    return color_dict
+def colors() -> types.MappingProxyType:
+    """Colors according to the GNOME color scheme (Color 4). The returned mapping is read-only and shared by all callers."""
+    return _COLORS
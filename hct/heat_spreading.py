@@ -5,6 +5,7 @@ CHRISTOPH GAMMETER
 Multi-Objective Optimization of Power Electronics and Generators of Airborne Wind Turbines
 """
 # Python libraries
+import math
 
 # 3rd party libraries
 import numpy as np
@@ -15,7 +16,7 @@ from hct.thermal_dataclasses import *
 from hct.cooling_system import *
 
 
-def calc_r_th_m(heat_spreading_material: SpreadingMaterial) -> float:
+def calc_r_th_m(heat_spreading_material: SpreadingMaterial) -> float | np.ndarray:
     """
     Calculate the R_th,d (heatsink baseplate).
 
@@ -27,18 +28,18 @@ def calc_r_th_m(heat_spreading_material: SpreadingMaterial) -> float:
     return r_th_d
 
 
-def calc_spreading_resistance_r_f(heat_spreading_material: SpreadingMaterial, psi: float):
+def calc_spreading_resistance_r_f(heat_spreading_material: SpreadingMaterial, psi: float | np.ndarray) -> float | np.ndarray:
     """
     Calculate the spreading resistance r_f.
 
     :param psi: dimensionless constriction resistance
     :param heat_spreading_material: SpreadingMaterial
     """
-    r_f = psi / heat_spreading_material.lambda_conductivity / np.sqrt(heat_spreading_material.heat_source_area_a_s)
+    r_f = psi / heat_spreading_material.lambda_conductivity / math.sqrt(heat_spreading_material.heat_source_area_a_s)
     return r_f
 
 
-def calc_dimensionless_constriction_resistance_psi(epsilon_spreading_material: float, phi_c: float) -> float:
+def calc_dimensionless_constriction_resistance_psi(epsilon_spreading_material: float, phi_c: float | np.ndarray) -> float | np.ndarray:
     """
     Calculate the dimensionless constriction resistance.
 
@@ -54,7 +55,7 @@ def calc_epsilon_spreading_material(heat_spreading_material: SpreadingMaterial)
 
     :param heat_spreading_material: SpreadingMaterial
     """
-    epsilon_spreading_material = np.sqrt(heat_spreading_material.heat_source_area_a_s / heat_spreading_material.spreading_material_area_a_sp)
+    epsilon_spreading_material = math.sqrt(heat_spreading_material.heat_source_area_a_s / heat_spreading_material.spreading_material_area_a_sp)
     return epsilon_spreading_material
 
 def calc_sigma_c(epsilon_spreading_material: float) -> float:
@@ -63,16 +64,16 @@ def calc_sigma_c(epsilon_spreading_material: float) -> float:
 
     :param epsilon_spreading_material: Epsilon for the spreading material
     """
-    sigma_c = np.pi + 1 / (np.sqrt(np.pi) * epsilon_spreading_material)
+    sigma_c = math.pi + 1 / (math.sqrt(math.pi) * epsilon_spreading_material)
     return sigma_c
 
-def calc_tau(heat_spreading_material: SpreadingMaterial) -> float:
+def calc_tau(heat_spreading_material: SpreadingMaterial) -> float | np.ndarray:
     """
     Calculate the tau factor.
 
     :param heat_spreading_material: SpreadingMaterial
     """
-    tau = heat_spreading_material.thickness_d * np.sqrt(np.pi / heat_spreading_material.spreading_material_area_a_sp)
+    tau = heat_spreading_material.thickness_d * math.sqrt(math.pi / heat_spreading_material.spreading_material_area_a_sp)
     return tau
 
 def calc_biot_number(heat_spreading_material: SpreadingMaterial, r_th_zero: float) -> float:
@@ -82,11 +83,11 @@ def calc_biot_number(heat_spreading_material: SpreadingMaterial, r_th_zero: floa
     :param heat_spreading_material: heat spreading material
     :param r_th_zero: thermal resistance for the rest of the system (cooling fins)
     """
-    denominator = r_th_zero * heat_spreading_material.lambda_conductivity * np.sqrt(np.pi * heat_spreading_material.spreading_material_area_a_sp)
+    denominator = r_th_zero * heat_spreading_material.lambda_conductivity * math.sqrt(math.pi * heat_spreading_material.spreading_material_area_a_sp)
     biot_number = 1 / denominator
     return biot_number
 
-def calc_phi_c(tau: float, sigma_c: float, biot_number: float) -> float:
+def calc_phi_c(tau: float | np.ndarray, sigma_c: float, biot_number: float) -> float | np.ndarray:
     """
     Calculate phi_c.
 
@@ -94,15 +95,19 @@ def calc_phi_c(tau: float, sigma_c: float, biot_number: float) -> float:
     :param sigma_c: sigma_c
     :param biot_number: biot number
     """
-    nominator = np.tanh(sigma_c * tau) + sigma_c / biot_number
-    denominator = 1 + sigma_c / biot_number * np.tanh(sigma_c * tau)
+    # np.tanh, as tau is an array in case of an array of thicknesses
+    tanh_sigma_c_tau = np.tanh(sigma_c * tau)
+    nominator = tanh_sigma_c_tau + sigma_c / biot_number
+    denominator = 1 + sigma_c / biot_number * tanh_sigma_c_tau
     phi_c = nominator / denominator
     return phi_c
 
-def calc_r_th_sp(spreading_material: SpreadingMaterial, r_th_zero: float) -> float:
+def calc_r_th_sp(spreading_material: SpreadingMaterial, r_th_zero: float) -> float | np.ndarray:
     """
     Calculate the r_th_sp for the spreading material.
 
+    For an array of thicknesses spreading_material.thickness_d, an array of r_th_sp is returned.
+
     :param spreading_material: SpreadingMaterial
     :param r_th_zero: r_th_zero, according to the paper, the rest of the heat sink.
     """
@@ -124,31 +129,3 @@ def calc_r_th_sp(spreading_material: SpreadingMaterial, r_th_zero: float) -> flo
     r_th_sp = r_f + r_m
 
     return r_th_sp
-
-
-def verify_with_phd_thesis_gammeter() -> None:
-    """Verify with figure 3.18 (page 149), Ph.D. thesis Gammeter."""
-    r_th_zero = 1
-    thickness_list = np.linspace(0.1e-3, 1.0e-3)
-
-    result_list_r_th_sp = []
-
-    for thickness in thickness_list:
-        mosfet_area = 4.04e-3 * 6.44e-3
-        spreading_material = SpreadingMaterial(heat_source_area_a_s=mosfet_area, spreading_material_area_a_sp=2 * mosfet_area, lambda_conductivity=400,
-                                               thickness_d=thickness)
-
-        r_th_sp = calc_r_th_sp(spreading_material, r_th_zero)
-
-        result_list_r_th_sp.append(r_th_sp)
-
-    plt.plot(thickness_list, result_list_r_th_sp, label='r_th_sp')
-    plt.xlabel("thickness in mm")
-    plt.ylabel('R_th in K/W')
-    plt.grid()
-    plt.legend()
-    plt.show()
-
-
-if __name__ == '__main__':
-    verify_with_phd_thesis_gammeter()
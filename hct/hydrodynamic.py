@@ -5,8 +5,6 @@ Christoph Gammeter, Florian Krismer, Johann Kolar: 'Weight Optimization of a Coo
 """
 # 3rd party libaries
 import numpy as np
-from matplotlib import pyplot as plt
-import pandas as pd
 
 # python libraries
 import os
@@ -16,13 +14,13 @@ from hct.thermal_dataclasses import *
 from hct.cooling_system import *
 from hct.generalplotsettings import *
 
-def calc_delta_p_heat_sink(f_app: float, k_se: float, k_sc: float, constants: Constants,
-                           geometry: Geometry, d_h: float, mean_u_hs: float) -> float:
+def calc_delta_p_heat_sink(f_app: float | np.ndarray, k_se: float, k_sc: float, constants: Constants,
+                           geometry: Geometry, d_h: float, mean_u_hs: float | np.ndarray) -> float | np.ndarray:
     """
     Calculate the pressure drop of the heat sink.
 
     :param f_app: apparent friction factor for viscous fluid flow in ducts
-    :type f_app: float
+    :type f_app: float | np.ndarray
     :param k_se: friction factor for sudden contraction
     :type k_se: float
     :param k_sc: friction factor for sudden expansion
@@ -34,9 +32,9 @@ def calc_delta_p_heat_sink(f_app: float, k_se: float, k_sc: float, constants: Co
     :param d_h:
     :type d_h: float
     :param mean_u_hs: average velocity inside the heat sink
-    :type mean_u_hs: float
+    :type mean_u_hs: float | np.ndarray
     :return: delta_p_heat_sink in Pacal (Pa).
-    :rtype: float
+    :rtype: float | np.ndarray
     """
     part_i = f_app * geometry.length_l / d_h + k_se + k_sc
     part_ii = constants.rho_air / 2 * mean_u_hs ** 2
@@ -64,7 +62,7 @@ def calc_k_sc(geometry: Geometry):
     k_sc = 0.42 * (1 - inner_bracket)
     return k_sc
 
-def calc_f_app(geometry: Geometry, constants: Constants, volume_flow_v_dot: float, f_re_sqrt_a: float):
+def calc_f_app(geometry: Geometry, constants: Constants, volume_flow_v_dot: float | np.ndarray, f_re_sqrt_a: float | np.ndarray):
     """
     Calculate the apparent friction factor for the average duct hydraulic parameter.
 
@@ -78,16 +76,16 @@ def calc_f_app(geometry: Geometry, constants: Constants, volume_flow_v_dot: floa
                    np.sqrt(geometry.height_c * geometry.fin_distance_s) * f_re_sqrt_a / volume_flow_v_dot)
     return f_app_v_dot
 
-def calc_delta_p_duct(f_app_duct: float, l_duct: float, mean_d_h_duct: float, constants: Constants, mean_u_duct: float):
+def calc_delta_p_duct(f_app_duct: float | np.ndarray, l_duct: float, mean_d_h_duct: float, constants: Constants, mean_u_duct: float | np.ndarray):
     """
     Calculate the duct static pressure drop.
 
     :param f_app_duct: apparent friction factor for viscous fluid flow in the air duct
-    :type f_app_duct: flaot
+    :type f_app_duct: float | np.ndarray
     :param l_duct: lenght of the air duct
     :type l_duct: float
     :param mean_u_duct: average velocity inside the heat sink
-    :type mean_u_duct: float
+    :type mean_u_duct: float | np.ndarray
     :param mean_d_h_duct: average velocity inside the air duct
     :type mean_d_h_duct: float
     :param constants: constants according to the Constants class
@@ -99,7 +97,7 @@ def calc_delta_p_duct(f_app_duct: float, l_duct: float, mean_d_h_duct: float, co
     delta_p_duct = part_i * part_ii
     return delta_p_duct
 
-def calc_f_app_duct(constants: Constants, geometry: Geometry, volume_flow_v_dot: float, f_re_sqrt_a_fd: float):
+def calc_f_app_duct(constants: Constants, geometry: Geometry, volume_flow_v_dot: float | np.ndarray, f_re_sqrt_a_fd: float | np.ndarray):
     """
     Calculate the apparent friction factor for the average duct hydraulic diameter.
 
@@ -107,20 +105,17 @@ def calc_f_app_duct(constants: Constants, geometry: Geometry, volume_flow_v_dot:
     :type constants: Constants
     :param geometry: Geometry
     :type geometry: Geometry
-    :param volume_flow_v_dot: Volume flow in m³/s
-    :type volume_flow_v_dot: float
+    :param volume_flow_v_dot: Volume flow in m³/s, scalar or array
+    :type volume_flow_v_dot: float | np.ndarray
     :param f_re_sqrt_a_fd: f_re_sqrt_a_fd
-    :type f_re_sqrt_a_fd: float
-    :return: Apparent friction factor for the average duct hydraulic diameter.
+    :type f_re_sqrt_a_fd: float | np.ndarray
+    :return: Apparent friction factor for the average duct hydraulic diameter, scalar or array.
+        nan (element-wise) in case of a non-physical result.
     """
     part_i = constants.fluid_viscosity_air * np.sqrt(geometry.width_b * (geometry.width_b + geometry.height_c)) / np.sqrt(2) / volume_flow_v_dot
     part_ii = 11.8336 * volume_flow_v_dot * 2 * np.tan(geometry.alpha_rad) / (geometry.width_b - geometry.height_c) / constants.fluid_viscosity_air
-    if part_ii < 0:
-        raise ValueError("negative part")
-    f_app_duct_v_dot = part_i * (part_ii + f_re_sqrt_a_fd ** 2) ** 0.5
-    if np.isnan(f_app_duct_v_dot) or f_app_duct_v_dot < 0:
-        raise ValueError(f"{f_app_duct_v_dot=}, bus should be a positive float.")
-    return f_app_duct_v_dot
+    f_app_duct_v_dot = part_i * np.where(part_ii < 0, np.nan, part_ii + f_re_sqrt_a_fd ** 2) ** 0.5
+    return np.where(f_app_duct_v_dot < 0, np.nan, f_app_duct_v_dot)[()]
 
 def calc_mean_d_h_duct(geometry: Geometry):
     """
@@ -136,15 +131,11 @@ def calc_l_duct(geometry: Geometry):
     Calculate the length of the air duct.
 
     :param geometry: Geometry
-    :return: Length of the air duct.
+    :return: Length of the air duct, scalar or array. nan (element-wise) in case of a heat sink height larger than the width.
     """
     l_duct = (geometry.width_b - geometry.height_c) / 2 / np.tan(geometry.alpha_rad)
 
-    if l_duct < 0:
-        raise ValueError("Fan too small.")
-    elif l_duct < geometry.l_duct_min:
-        l_duct = geometry.l_duct_min
-    return l_duct
+    return np.where(l_duct < 0, np.nan, np.maximum(l_duct, geometry.l_duct_min))[()]
 
 def calc_epsilon_duct(geometry: Geometry):
     """
@@ -157,7 +148,7 @@ def calc_epsilon_duct(geometry: Geometry):
     return epsilon_duct
 
 
-def calc_mean_u_hs(geometry: Geometry, volume_flow_v_dot: float):
+def calc_mean_u_hs(geometry: Geometry, volume_flow_v_dot: float | np.ndarray):
     """
     Calculate the average velocity inside the heat sink.
 
@@ -169,7 +160,7 @@ def calc_mean_u_hs(geometry: Geometry, volume_flow_v_dot: float):
     return u_hs_v_dot
 
 
-def calc_mean_u_duct(geometry: Geometry, volume_flow_v_dot: float):
+def calc_mean_u_duct(geometry: Geometry, volume_flow_v_dot: float | np.ndarray):
     """
     Calculate the average velocity inside the air duct.
 
@@ -181,7 +172,7 @@ def calc_mean_u_duct(geometry: Geometry, volume_flow_v_dot: float):
     return mean_u_duct
 
 
-def calc_delta_p_acc(geometry: Geometry, volume_flow_v_dot: float, constants: Constants):
+def calc_delta_p_acc(geometry: Geometry, volume_flow_v_dot: float | np.ndarray, constants: Constants):
     """
     Calculate the pressure drop for the frictionless fluid flow acceleration.
 
@@ -196,17 +187,44 @@ def calc_delta_p_acc(geometry: Geometry, volume_flow_v_dot: float, constants: Co
     return delta_p_acc
 
 
-def compare_fan_data() -> None:
-    """Plot all available fan data for comparison."""
-    for (_, _, file_name_list) in os.walk('data/'):
-        for file_name in file_name_list:
-            fan_cubic_meter_second, fan_pressure_drop_pascal = read_fan_data(f'data/{file_name}')
-            plt.plot(fan_cubic_meter_second, fan_pressure_drop_pascal, label=f'{file_name}')
-    plt.xlabel('cubic meter per second')
-    plt.ylabel('pressure drop in pascal')
-    plt.grid()
-    plt.legend()
-    plt.show()
+def calc_delta_p_total(geometry: Geometry, constants: Constants, volume_flow_v_dot: float | np.ndarray) -> float | np.ndarray:
+    """
+    Calculate the total static pressure drop of heat sink, duct and air acceleration for the given volume flow.
+
+    The geometry parameters are calculated once, the volume flow dependent parameters for all volume flows at once.
+
+    :param geometry: Geometry, including the fin distance s
+    :type geometry: Geometry
+    :param constants: Constants
+    :type constants: Constants
+    :param volume_flow_v_dot: Volume flow in m³/s, scalar or array
+    :type volume_flow_v_dot: float | np.ndarray
+    :return: total pressure drop in Pa, scalar or array. nan (element-wise) in case of a non-physical geometry or volume flow.
+    """
+    # geometry parameters, independent of the volume flow
+    epsilon = calc_epsilon(geometry)
+    d_h = calc_d_h(geometry)
+    k_se = calc_k_se(geometry)
+    k_sc = calc_k_sc(geometry)
+    friction_factor_reynolds_product_fd = calc_friction_factor_reynolds_product_fd(epsilon)
+    mean_d_h_duct = calc_mean_d_h_duct(geometry)
+    l_duct = calc_l_duct(geometry)
+
+    # delta_p_heat_sink
+    friction_factor_reynolds_product = calc_friction_factor_reynolds_product(geometry, volume_flow_v_dot, constants, friction_factor_reynolds_product_fd)
+    mean_u_hs = calc_mean_u_hs(geometry, volume_flow_v_dot)
+    f_app = calc_f_app(geometry, constants, volume_flow_v_dot, friction_factor_reynolds_product)
+    delta_p_heat_sink = calc_delta_p_heat_sink(f_app, k_se, k_sc, constants, geometry, d_h, mean_u_hs)
+
+    # delta_p_duct
+    mean_u_duct = calc_mean_u_duct(geometry, volume_flow_v_dot)
+    f_app_duct = calc_f_app_duct(constants, geometry, volume_flow_v_dot, friction_factor_reynolds_product)
+    delta_p_duct = calc_delta_p_duct(f_app_duct, l_duct, mean_d_h_duct, constants, mean_u_duct)
+
+    # delta_p_acc
+    delta_p_acc = calc_delta_p_acc(geometry, volume_flow_v_dot, constants)
+
+    return delta_p_acc + delta_p_duct + delta_p_heat_sink
 
 
 def read_fan_data(filepath: str):
@@ -216,9 +234,10 @@ def read_fan_data(filepath: str):
     :param filepath: Filepath to fan .csv-file.
     :return: fan_cubic_meter_second, fan_pressure_drop_pascal
     """
-    # read fan curve
-    fan_data = pd.read_csv(filepath, delimiter=';', decimal=',')
-    fan_data = fan_data.to_numpy()
+    # read fan curve. The files have no header line, decimal separator is ','
+    fan_data = np.loadtxt(filepath, delimiter=';', converters=lambda value: float(value.replace(',', '.')))
+    # digitized curves may start slightly below zero volume flow, these points are not physical
+    fan_data = fan_data[fan_data[:, 0] > 0]
 
     fan_cfm = fan_data[:, 0]
     fan_inch_h2o = fan_data[:, 1]
@@ -234,7 +253,35 @@ def read_fan_data(filepath: str):
     return fan_cubic_meter_second, fan_pressure_drop_pascal
 
 
-def calc_volume_flow(fan_name: str, geometry: Geometry, plot: bool = False, figure_size: tuple | None = None):
+# fan-database: directory of the fan .csv-files and sorted tuple of all fan file names, e.g. 'orion_od4010h.csv'
+FAN_DATA_DIRECTORY = os.path.join(os.path.dirname(__file__), "data")
+FAN_LIST = tuple(sorted(file_name for file_name in os.listdir(FAN_DATA_DIRECTORY) if file_name.endswith('.csv')))
+
+# fan curves read from the fan .csv-files, see read_fan_data_cached()
+_fan_curve_cache = {}
+
+
+def read_fan_data_cached(fan_name: str):
+    """
+    Read the fan curve of a fan from the fan-database. Each .csv-file is only read once, further calls use the cache.
+
+    The returned arrays are shared by all callers and therefore read-only. Use .copy() to modify them.
+
+    :param fan_name: with or without '.csv', e.g. 'orion_od4010h' or 'orion_od4010h.csv'
+    :type fan_name: str
+    :return: fan_cubic_meter_second, fan_pressure_drop_pascal
+    """
+    fan_name = fan_name.replace('.csv', '')
+    if fan_name not in _fan_curve_cache:
+        fan_curve = read_fan_data(os.path.join(FAN_DATA_DIRECTORY, f"{fan_name}.csv"))
+        for fan_curve_array in fan_curve:
+            fan_curve_array.setflags(write=False)
+        _fan_curve_cache[fan_name] = fan_curve
+    return _fan_curve_cache[fan_name]
+
+
+def calc_volume_flow(fan_name: str, geometry: Geometry, plot: bool = False, figure_size: tuple | None = None,
+                     ax: "matplotlib.axes.Axes | None" = None):
     """
     Calculate the volume flow for a given fan and a given geometry.
 
@@ -248,112 +295,112 @@ def calc_volume_flow(fan_name: str, geometry: Geometry, plot: bool = False, figu
     :type plot: bool
     :param figure_size: Figure size in mm, e.g. (80, 60) is a 80 mm wide and 60 mm height plot
     :type figure_size: tuple
-    :return: intersection_volume_flow, intersection_pressure
+    :param ax: matplotlib axes to plot into, e.g. to reuse one figure for several fans. The plot is not shown then.
+    :type ax: matplotlib.axes.Axes | None
+    :return: intersection_volume_flow, intersection_pressure. nan, nan in case of no valid operating point,
+        also if a plot is requested. The curves are plotted without the operating point marker then.
     """
-    fan_directory = os.path.join(os.path.dirname(__file__), "data", fan_name)
-
-    fan_cubic_meter_second, fan_pressure_drop_pascal = read_fan_data(fan_directory)
+    fan_cubic_meter_second, fan_pressure_drop_pascal = read_fan_data_cached(fan_name)
 
     # calculate static pressure of system
-    constants = init_constants()
-    geometry.fin_distance_s = calc_fin_distance_s(geometry)
-
-    result_list_delta_p_duct = []
-    result_list_delta_p_heat_sink = []
-    result_list_delta_p_acc = []
-    result_list_delta_p_total = []
-
-    for volume_flow_v_dot in fan_cubic_meter_second:
-        # delta_p_heat_sink
-        epsilon = calc_epsilon(geometry)
-        d_h = calc_d_h(geometry)
-        k_se = calc_k_se(geometry)
-        k_sc = calc_k_sc(geometry)
-        friction_factor_reynolds_product_fd = calc_friction_factor_reynolds_product_fd(epsilon)
-        friction_factor_reynolds_product = calc_friction_factor_reynolds_product(geometry, volume_flow_v_dot, constants, friction_factor_reynolds_product_fd)
-        mean_u_hs = calc_mean_u_hs(geometry, volume_flow_v_dot)
-        f_app = calc_f_app(geometry, constants, volume_flow_v_dot, friction_factor_reynolds_product)
-        delta_p_heat_sink = calc_delta_p_heat_sink(f_app, k_se, k_sc, constants, geometry, d_h, mean_u_hs)
-
-        # delta_p_duct
-        mean_d_h_duct = calc_mean_d_h_duct(geometry)
-        l_duct = calc_l_duct(geometry)
-        # epsilon_duct = calc_epsilon_duct(geometry)
-        mean_u_duct = calc_mean_u_duct(geometry, volume_flow_v_dot)
-
-        f_app_duct = calc_f_app_duct(constants, geometry, volume_flow_v_dot, friction_factor_reynolds_product)
-        if np.isnan(f_app_duct):
-            return np.nan, np.nan
-        delta_p_duct = calc_delta_p_duct(f_app_duct, l_duct, mean_d_h_duct, constants, mean_u_duct)
-
-        # delta_p_acc
-        delta_p_acc = calc_delta_p_acc(geometry, volume_flow_v_dot, constants)
-
-        delta_p_total = delta_p_acc + delta_p_duct + delta_p_heat_sink
-
-        result_list_delta_p_acc.append(delta_p_acc)
-        result_list_delta_p_duct.append(delta_p_duct)
-        result_list_delta_p_heat_sink.append(delta_p_heat_sink)
-        result_list_delta_p_total.append(delta_p_total)
-
-    fan_cubic_meter_second, result_list_delta_p_total, fan_pressure_drop_pascal, intersection_volume_flow, intersection_pressure = calculate_intersection(
-        fan_cubic_meter_second, result_list_delta_p_total, fan_pressure_drop_pascal)
-
-    if plot:
-        plt.figure(figsize=[x / 25.4 for x in figure_size] if figure_size is not None else None, dpi=80)
-        plt.plot(fan_cubic_meter_second, np.array(result_list_delta_p_total), label=r'Heat sink', color=colors()["blue"])
-        plt.plot(fan_cubic_meter_second, fan_pressure_drop_pascal, label="Fan", color=colors()["orange"])  # : {fan_name.replace('.csv', '')}
-        plt.plot(intersection_volume_flow, intersection_pressure, color=colors()["red"], marker='o')
-        plt.xlabel('Volume flow / (m³/s)')
-        plt.ylabel(r'Pressure drop $\Delta p$ / Pa')
-        plt.grid()
-        plt.legend()
+    delta_p_total = calc_delta_p_total(geometry, CONSTANTS, fan_cubic_meter_second)
+    if np.isnan(delta_p_total).any():
+        return np.nan, np.nan
+
+    if not plot and ax is None:
+        return calc_intersection_point(fan_cubic_meter_second, delta_p_total, fan_pressure_drop_pascal)
+
+    intersection_volume_flow, intersection_pressure, intersection_index = _calc_intersection_point_index(
+        fan_cubic_meter_second, delta_p_total, fan_pressure_drop_pascal)
+    if intersection_index >= 0:
+        # complement both curves by the intersection point, so they pass exactly through the marker
+        fan_cubic_meter_second, delta_p_total, fan_pressure_drop_pascal, _, _ = calculate_intersection(
+            fan_cubic_meter_second, delta_p_total, fan_pressure_drop_pascal)
+
+    from matplotlib import pyplot as plt
+
+    show = ax is None
+    if show:
+        _, ax = plt.subplots(figsize=[x / 25.4 for x in figure_size] if figure_size is not None else None, dpi=80)
+    ax.plot(fan_cubic_meter_second, delta_p_total, label=r'Heat sink', color=colors()["blue"])
+    ax.plot(fan_cubic_meter_second, fan_pressure_drop_pascal, label="Fan", color=colors()["orange"])  # : {fan_name.replace('.csv', '')}
+    if intersection_index >= 0:
+        ax.plot(intersection_volume_flow, intersection_pressure, color=colors()["red"], marker='o')
+    ax.set_xlabel('Volume flow / (m³/s)')
+    ax.set_ylabel(r'Pressure drop $\Delta p$ / Pa')
+    ax.grid()
+    ax.legend()
+    if show:
         plt.tight_layout()
         plt.show()
 
     return intersection_volume_flow, intersection_pressure
 
-def calculate_intersection(x_list: list, y1_list: list, y2_list: list):
+def calc_intersection_point(x_list: np.ndarray, y1_list: np.ndarray, y2_list: np.ndarray) -> tuple[float, float]:
     """
-    Calculate the intersection between two graphs (x_list, y1_list) and (x_list, y2_list).
+    Calculate the first intersection point between two graphs (x_list, y1_list) and (x_list, y2_list).
 
-    The return are both lists (x_list, y1_list) and (x_list, y2_list) added by the intersection points
-    as well as the intersection point itself.
+    Between the two points next to the intersection, both graphs are interpolated linearly.
     :param x_list: common x-coordinates of the two graphs
-    :type x_list: list
+    :type x_list: np.ndarray
     :param y1_list: y-coordinates of graph 1
-    :type y1_list: list
+    :type y1_list: np.ndarray
     :param y2_list: y-coordinates of graph 2
-    :type y2_list: list
-    :return: x_list, y1_list, y2_list (lists are complemented by the intersection point), x_intersection, y_intersection
+    :type y2_list: np.ndarray
+    :return: x_intersection, y_intersection. nan, nan in case the graphs do not intersect.
+    """
+    x_intersection, y_intersection, _ = _calc_intersection_point_index(x_list, y1_list, y2_list)
+    return x_intersection, y_intersection
+
+def _calc_intersection_point_index(x_list: np.ndarray, y1_list: np.ndarray, y2_list: np.ndarray) -> tuple[float, float, int]:
     """
-    [intersection_index] = np.argwhere(np.diff(np.sign(y1_list - y2_list))).flatten()
+    Calculate the first intersection point between two graphs, see calc_intersection_point().
 
-    m1 = (y1_list[intersection_index + 1] - y1_list[intersection_index]) / (x_list[intersection_index + 1] - x_list[intersection_index])
-    m2 = (y2_list[intersection_index + 1] - y2_list[intersection_index]) / (x_list[intersection_index + 1] - x_list[intersection_index])
+    :param x_list: common x-coordinates of the two graphs
+    :type x_list: np.ndarray
+    :param y1_list: y-coordinates of graph 1
+    :type y1_list: np.ndarray
+    :param y2_list: y-coordinates of graph 2
+    :type y2_list: np.ndarray
+    :return: x_intersection, y_intersection, intersection_index (intersection is between intersection_index and intersection_index + 1).
+        nan, nan, -1 in case the graphs do not intersect.
+    """
+    sign_changes = np.flatnonzero(np.diff(np.sign(y1_list - y2_list)))
+    if sign_changes.size == 0:
+        return np.nan, np.nan, -1
+    intersection_index = sign_changes[0]
+
+    delta_x = x_list[intersection_index + 1] - x_list[intersection_index]
+    m1 = (y1_list[intersection_index + 1] - y1_list[intersection_index]) / delta_x
+    m2 = (y2_list[intersection_index + 1] - y2_list[intersection_index]) / delta_x
     t1 = y1_list[intersection_index] - m1 * x_list[intersection_index]
     t2 = y2_list[intersection_index] - m2 * x_list[intersection_index]
 
     x_intersection = (t2 - t1) / (m1 - m2)
     y_intersection = m1 * x_intersection + t1
 
+    return x_intersection, y_intersection, intersection_index
+
+def calculate_intersection(x_list: np.ndarray, y1_list: np.ndarray, y2_list: np.ndarray):
+    """
+    Calculate the intersection between two graphs (x_list, y1_list) and (x_list, y2_list).
+
+    The return are both lists (x_list, y1_list) and (x_list, y2_list) added by the intersection points
+    as well as the intersection point itself. If only the intersection point is needed, use calc_intersection_point().
+    :param x_list: common x-coordinates of the two graphs
+    :type x_list: np.ndarray
+    :param y1_list: y-coordinates of graph 1
+    :type y1_list: np.ndarray
+    :param y2_list: y-coordinates of graph 2
+    :type y2_list: np.ndarray
+    :return: x_list, y1_list, y2_list (lists are complemented by the intersection point), x_intersection, y_intersection
+    """
+    x_intersection, y_intersection, intersection_index = _calc_intersection_point_index(x_list, y1_list, y2_list)
+    if intersection_index < 0:
+        raise ValueError("The two graphs do not intersect.")
+
     x_list = np.insert(x_list, intersection_index + 1, x_intersection)
     y1_list = np.insert(y1_list, intersection_index + 1, y_intersection)
     y2_list = np.insert(y2_list, intersection_index + 1, y_intersection)
 
     return x_list, y1_list, y2_list, x_intersection, y_intersection
-
-
-if __name__ == '__main__':
-
-    # global_plot_settings_font_latex()
-
-    compare_fan_data()
-
-    geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5, thickness_fin_t=1e-3,
-                        fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
-
-    for (_, _, fan_name_list) in os.walk('data/'):
-        for fan_name in fan_name_list:
-            # fan_name = 'orion_od4010hh.csv'
-            calc_volume_flow(fan_name, geometry, plot=True)
@@ -1,5 +1,6 @@
 """Heat sink system optimization using optuna."""
 # python libraries
+import math
 import os
 import datetime
 import pickle
@@ -8,6 +9,7 @@ import logging
 # 3rd party libraries
 import optuna
 import numpy as np
+import pandas as pd
 import deepdiff
 
 # package libraries
@@ -16,6 +18,51 @@ from hct.cooling_system import *
 from hct.hydrodynamic import *
 from hct.generalplotsettings import *
 
+# duct angle alpha of all optimized cooling systems, as float to not convert it in every trial
+_ALPHA_RAD_DUCT = math.radians(40)
+
+
+def _journal_storage(journal_filepath: str) -> optuna.storages.JournalStorage:
+    """
+    Create an optuna journal storage in the given file.
+
+    The journal file is safe for several processes appending to the same file: each append is serialized by a file lock
+    (a symlink lock by default). It suits parallel workers better than sqlite.
+
+    :param journal_filepath: filepath to the journal file
+    :type journal_filepath: str
+    :return: journal storage
+    :rtype: optuna.storages.JournalStorage
+    """
+    try:
+        from optuna.storages.journal import JournalFileBackend
+    except ImportError:
+        # optuna < 4.0
+        from optuna.storages import JournalFileStorage as JournalFileBackend
+    return optuna.storages.JournalStorage(JournalFileBackend(journal_filepath))
+
+
+# RDB storages by their URL, so that resuming a study in the same process reuses the database engine, see _rdb_storage()
+_rdb_storage_cache = {}
+
+
+def _rdb_storage(storage_url: str) -> optuna.storages.RDBStorage:
+    """
+    Get the optuna RDB storage for the given URL. The storage is created once and reused for further calls.
+
+    :param storage_url: database URL, e.g. 'sqlite:///...' or 'mysql://...'
+    :type storage_url: str
+    :return: RDB storage
+    :rtype: optuna.storages.RDBStorage
+    """
+    if storage_url not in _rdb_storage_cache:
+        engine_kwargs = {"pool_pre_ping": True}
+        if storage_url.startswith('sqlite'):
+            # wait for a locked database (e.g. by a parallel process) instead of failing after the default 5 s
+            engine_kwargs["connect_args"] = {"timeout": 30}
+        _rdb_storage_cache[storage_url] = optuna.storages.RDBStorage(url=storage_url, engine_kwargs=engine_kwargs)
+    return _rdb_storage_cache[storage_url]
+
 
 class Optimization:
     """Optuna optimization for heat sink and fan optimization."""
@@ -29,7 +76,7 @@ class Optimization:
         :type trial: optuna.Trial
         :param config: optimization configuration according to OptimizationParameters class
         :type config: OptimizationParameters
-        :return: total_volume, r_th_sa in case of success, nan,nan in case of unrealistic geometry parameters
+        :return: total_volume, r_th_sa (and area for 3 directions). Unrealistic geometry parameters prune the trial (optuna.TrialPruned).
         """
         fan_name = trial.suggest_categorical("fan", config.fan_list)
         height_c = trial.suggest_float("height_c", config.height_c_list[0], config.height_c_list[1])
@@ -39,53 +86,52 @@ class Optimization:
         thickness_fin_t = trial.suggest_float("thickness_fin_t", config.thickness_fin_t_list[0], config.thickness_fin_t_list[1])
         number_fins_n = trial.suggest_int("number_fins_n", config.number_fins_n_list[0], config.number_fins_n_list[1])
 
-        constants = init_constants()
+        constants = CONSTANTS
         geometry = Geometry(height_c=height_c, height_d=height_d, length_l=length_l, width_b=width_b, number_fins_n=number_fins_n,
-                            thickness_fin_t=thickness_fin_t, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
-        geometry.fin_distance_s = calc_fin_distance_s(geometry)
+                            thickness_fin_t=thickness_fin_t, fin_distance_s=0, alpha_rad=_ALPHA_RAD_DUCT, l_duct_min=5e-3)
         if geometry.fin_distance_s <= 0.1e-3:
-            return float('nan'), float('nan')
+            raise optuna.TrialPruned()
 
-        try:
-            area = width_b * length_l
+        area = width_b * length_l
 
-            if config.number_directions == 2 and area < config.area_min:
-                return float('nan'), float('nan')
+        if config.number_directions == 2 and area < config.area_min:
+            raise optuna.TrialPruned()
 
-            volume_flow_v_dot, pressure = calc_volume_flow(fan_name, geometry, plot=False)
+        if not is_geometry_feasible(geometry, fan_name):
+            raise optuna.TrialPruned()
 
-            if np.isnan(volume_flow_v_dot):
-                return float('nan'), float('nan')
+        volume_flow_v_dot, pressure = calc_volume_flow(fan_name, geometry, plot=False)
 
-            r_th_sa = calc_final_r_th_s_a(geometry, constants, config.t_ambient, volume_flow_v_dot)
-            # weight = calc_weight_heat_sink(geometry, constants)
-            total_volume = calc_total_volume(geometry, fan_name)
+        if np.isnan(volume_flow_v_dot):
+            raise optuna.TrialPruned()
 
-            if config.number_directions == 2:
-                return total_volume, r_th_sa
-            elif config.number_directions == 3:
-                return total_volume, r_th_sa, area
-        except:
-            if config.number_directions == 2:
-                return float('nan'), float('nan')
-            elif config.number_directions == 3:
-                return float('nan'), float('nan'), float('nan')
+        r_th_sa = calc_final_r_th_s_a(geometry, constants, config.t_ambient, volume_flow_v_dot)
+        # weight = calc_weight_heat_sink(geometry, constants)
+        total_volume = calc_total_volume(geometry, fan_name)
+
+        if config.number_directions == 2:
+            return total_volume, r_th_sa
+        return total_volume, r_th_sa, area
 
     @staticmethod
     def start_proceed_study(config: OptimizationParameters, number_trials: int, storage: str = 'sqlite',
-                            sampler=optuna.samplers.NSGAIIISampler()) -> None:
+                            sampler: optuna.samplers.BaseSampler | None = None, number_jobs: int = 1) -> None:
         """Proceed a study which is stored as sqlite database.
 
         :param number_trials: Number of trials adding to the existing study
         :type number_trials: int
-        :param storage: storage database, e.g. 'sqlite' or 'mysql'
+        :param number_jobs: Number of parallel jobs, -1 to use the number of CPU cores. Note: optuna runs the jobs as threads.
+        :type number_jobs: int
+        :param storage: storage database, e.g. 'sqlite', 'journal' (for several parallel processes) or 'mysql'
         :type storage: str
-        :param sampler: optuna.samplers.NSGAIISampler() or optuna.samplers.NSGAIIISampler(). Note about the brackets () !! Default: NSGAIII
-        :type sampler: optuna.sampler-object
+        :param sampler: e.g. optuna.samplers.TPESampler(), optuna.samplers.NSGAIISampler() or optuna.samplers.NSGAIIISampler().
+            Note about the brackets () !! Default (None): multivariate TPESampler, which needs fewer trials than NSGA for this low-dimensional problem
+        :type sampler: optuna.samplers.BaseSampler | None
         :param config: configuration according to OptimizationParameters class
         :type config: OptimizationParameters
         """
-        if os.path.exists(f"{config.heat_sink_optimization_directory}/{config.heat_sink_study_name}.sqlite3"):
+        if os.path.exists(f"{config.heat_sink_optimization_directory}/{config.heat_sink_study_name}.sqlite3") or \
+                os.path.exists(f"{config.heat_sink_optimization_directory}/{config.heat_sink_study_name}.log"):
             print("Existing study found. Proceeding.")
         else:
             os.makedirs(config.heat_sink_optimization_directory, exist_ok=True)
@@ -95,8 +141,10 @@ class Optimization:
             # Note: for sqlite operation, there needs to be three slashes '///' even before the path '/home/...'
             # Means, in total there are four slashes including the path itself '////home/.../database.sqlite3'
             storage = f"sqlite:///{config.heat_sink_optimization_directory}/{config.heat_sink_study_name}.sqlite3"
+        elif storage == 'journal':
+            storage = _journal_storage(f"{config.heat_sink_optimization_directory}/{config.heat_sink_study_name}.log")
         elif storage == 'mysql':
-            storage = "mysql://monty@localhost/mydb",
+            storage = "mysql://monty@localhost/mydb"
 
         # set logging verbosity: https://optuna.readthedocs.io/en/stable/reference/generated/optuna.logging.set_verbosity.html#optuna.logging.set_verbosity
         # .INFO: all messages (default)
@@ -107,17 +155,21 @@ class Optimization:
         # check for differences with the old configuration file
         config_on_disk_filepath = f"{config.heat_sink_optimization_directory}/{config.heat_sink_study_name}.pkl"
         if os.path.exists(config_on_disk_filepath):
-            config_on_disk = Optimization.load_config(config_on_disk_filepath)
-            difference = deepdiff.DeepDiff(config_on_disk, config, ignore_order=True, significant_digits=10)
-            if difference:
-                print("Configuration file has changed from previous simulation. Do you want to proceed?")
-                print(f"Difference: {difference}")
-                read_text = input("'1' or Enter: proceed, 'any key': abort\nYour choice: ")
-                if read_text == str(1) or read_text == "":
-                    print("proceed...")
-                else:
-                    print("abort...")
-                    return None
+            with open(config_on_disk_filepath, 'rb') as config_on_disk_file:
+                config_on_disk_pickle = config_on_disk_file.read()
+            # an unchanged configuration pickles to the same bytes, so the slow DeepDiff is only needed in case of changes
+            if config_on_disk_pickle != pickle.dumps(config, pickle.HIGHEST_PROTOCOL):
+                config_on_disk = pickle.loads(config_on_disk_pickle)
+                difference = deepdiff.DeepDiff(config_on_disk, config, ignore_order=True, significant_digits=10)
+                if difference:
+                    print("Configuration file has changed from previous simulation. Do you want to proceed?")
+                    print(f"Difference: {difference}")
+                    read_text = input("'1' or Enter: proceed, 'any key': abort\nYour choice: ")
+                    if read_text == str(1) or read_text == "":
+                        print("proceed...")
+                    else:
+                        print("abort...")
+                        return None
 
         if config.number_directions == 2:
             directions = ['minimize', 'minimize']
@@ -126,20 +178,34 @@ class Optimization:
         else:
             logging.error(f"number_directions to optimize must be 2 or 3, but it is {config.number_directions}.")
 
+        if sampler is None:
+            # constant_liar avoids evaluating similar parameters in parallel trials, see number_jobs
+            sampler = optuna.samplers.TPESampler(multivariate=True, group=True, constant_liar=True)
+
         func = lambda trial: Optimization.objective(trial, config)
         optuna.logging.set_verbosity(optuna.logging.ERROR)
 
+        # sqlite writes each trial in several transactions, which makes the optimization about two times slower.
+        # So the trials run in a copy of the study in memory, and the new trials are written to sqlite at the end.
+        use_study_in_memory = isinstance(storage, str) and storage.startswith('sqlite')
+        if isinstance(storage, str):
+            storage = _rdb_storage(storage)
+
         study_in_storage = optuna.create_study(study_name=config.heat_sink_study_name,
                                                storage=storage,
                                                directions=directions,
                                                load_if_exists=True, sampler=sampler)
+        print(f"Sampler is {study_in_storage.sampler.__class__.__name__}")
 
-        study_in_memory = optuna.create_study(directions=directions, study_name=config.heat_sink_study_name, sampler=sampler)
-        print(f"Sampler is {study_in_memory.sampler.__class__.__name__}")
-        study_in_memory.add_trials(study_in_storage.trials)
-        study_in_memory.optimize(func, n_trials=number_trials, show_progress_bar=True)
+        if use_study_in_memory:
+            study_in_memory = optuna.create_study(directions=directions, study_name=config.heat_sink_study_name, sampler=sampler)
+            study_in_memory.add_trials(study_in_storage.trials)
+            study_in_memory.optimize(func, n_trials=number_trials, n_jobs=number_jobs, show_progress_bar=True)
+            study_in_storage.add_trials(study_in_memory.trials[-number_trials:])
+        else:
+            # journal and server storages can be shared with other processes, so the trials are written directly
+            study_in_storage.optimize(func, n_trials=number_trials, n_jobs=number_jobs, show_progress_bar=True)
 
-        study_in_storage.add_trials(study_in_memory.trials[-number_trials:])
         print(f"Finished {number_trials} trials.")
         print(f"current time: {datetime.datetime.now()}")
         Optimization.save_config(config)
@@ -176,17 +242,24 @@ class Optimization:
         """
         Create a Pandas dataframe from a study.
 
+        The study is read from the sqlite database or, if there is none, from the journal file.
+
         :param config: configuration
         :type config: OptimizationParameters
         :return: Study results as Pandas Dataframe
         :rtype: pd.DataFrame
         """
         database_url = f'sqlite:///{os.path.abspath(config.heat_sink_optimization_directory)}/{config.heat_sink_study_name}.sqlite3'
+        journal_filepath = f'{os.path.abspath(config.heat_sink_optimization_directory)}/{config.heat_sink_study_name}.log'
         if os.path.isfile(database_url.replace('sqlite:///', '')):
             print("Existing study found.")
+            storage = _rdb_storage(database_url)
+        elif os.path.isfile(journal_filepath):
+            print("Existing study found.")
+            storage = _journal_storage(journal_filepath)
         else:
             raise ValueError(f"Can not find database: {database_url}")
-        loaded_study = optuna.load_study(study_name=config.heat_sink_study_name, storage=database_url)
+        loaded_study = optuna.load_study(study_name=config.heat_sink_study_name, storage=storage)
         df = loaded_study.trials_dataframe()
         df.to_csv(f'{config.heat_sink_optimization_directory}/{config.heat_sink_study_name}.csv')
         logging.info(f"Exported study as .csv file: {config.heat_sink_optimization_directory}/{config.heat_sink_study_name}.csv")
@@ -202,6 +275,8 @@ class Optimization:
         :param figure_size: figures size as a x/y-tuple in mm, e.g. (160, 80)
         :type figure_size: tuple
         """
+        from matplotlib import pyplot as plt
+
         names = df["number"].to_numpy()
         # plt.figure()
         fig, ax = plt.subplots(figsize=[x / 25.4 for x in figure_size] if figure_size is not None else None, dpi=80)
@@ -212,6 +287,16 @@ class Optimization:
                             arrowprops=dict(arrowstyle="->"))
         annot.set_visible(False)
 
+        # hover radius in pixels: pick radius plus marker radius (marker size s=10 is given in points²)
+        points = np.column_stack([df["values_0"].to_numpy(dtype=float), df["values_1"].to_numpy(dtype=float)])
+        hover_radius = sc.get_pickradius() + np.sqrt(10) / 2 * fig.dpi / 72
+
+        def contains(event):
+            # vectorized distance check in display coordinates, much faster than sc.contains() for many trials
+            points_display = ax.transData.transform(points)
+            ind = np.flatnonzero(np.hypot(points_display[:, 0] - event.x, points_display[:, 1] - event.y) < hover_radius)
+            return ind.size > 0, {"ind": ind}
+
         def update_annot(ind):
             pos = sc.get_offsets()[ind["ind"][0]]
             annot.xy = pos
@@ -222,7 +307,7 @@ class Optimization:
         def hover(event):
             vis = annot.get_visible()
             if event.inaxes == ax:
-                cont, ind = sc.contains(event)
+                cont, ind = contains(event)
                 if cont:
                     update_annot(ind)
                     annot.set_visible(True)
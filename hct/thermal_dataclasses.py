@@ -1,14 +1,24 @@
 """Dataclass definitions."""
 # Python libraries
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
+# 3rd party libraries
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Geometry:
     """Define a single heat sink geometry.
 
     l_duct_min: minimum length of the air duct.
+    fin_distance_s: distance between two fins. If given as 0, it is calculated from the other parameters by
+    calc_fin_distance_s() on construction. For array geometries, only the elements given as 0 are calculated.
+    The fin distance is fixed at construction: changing width_b, number_fins_n or thickness_fin_t afterwards does
+    not update it. Create a new Geometry (e.g. dataclasses.replace(geometry, ..., fin_distance_s=0)) instead.
+
+    The parameters may also be numpy arrays of the same shape to describe several geometries at once, e.g. for
+    calc_fin_distance_s(), calc_final_r_th_s_a() or calc_boxed_volume_heat_sink().
     """
 
     height_c: float
@@ -21,10 +31,21 @@ class Geometry:
     alpha_rad: float
     l_duct_min: float
 
+    def __post_init__(self):
+        """Calculate the fin distance, if it is not given."""
+        is_not_given = np.equal(self.fin_distance_s, 0)
+        if np.any(is_not_given):
+            # imported here, as hct.cooling_system itself imports the dataclasses
+            from hct.cooling_system import calc_fin_distance_s
+            self.fin_distance_s = np.where(is_not_given, calc_fin_distance_s(self), self.fin_distance_s)[()]
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Constants:
-    """Define constants."""
+    """Define constants.
+
+    rho_c_air: volumetric heat capacity of air (rho_air * c_air), derived from the given constants.
+    """
 
     c_1: float
     c_2: float
@@ -38,6 +59,11 @@ class Constants:
     lambda_material: float
     rho_material: float
     k_venturi: float
+    rho_c_air: float = field(init=False)
+
+    def __post_init__(self):
+        """Calculate the derived constants."""
+        object.__setattr__(self, "rho_c_air", self.rho_air * self.c_air)
 
 
 @dataclass
@@ -69,7 +95,7 @@ class OptimizationParameters:
     area_min: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FanData:
     """Define fan data."""
 
@@ -80,11 +106,11 @@ class FanData:
     weight: float
     datasheet: str
 
-@dataclass
+@dataclass(slots=True)
 class SpreadingMaterial:
-    """Define the heat spreading material."""
+    """Define the heat spreading material. thickness_d may be an array to calculate several thicknesses at once."""
 
     lambda_conductivity: float
-    thickness_d: float
+    thickness_d: float | np.ndarray
     heat_source_area_a_s: float
     spreading_material_area_a_sp: float
@@ -1,4 +1,12 @@
 """Unit and integration tests for the heat sink computing toolbox."""
+# python libraries
+import os
+import dataclasses
+
+# 3rd party libraries
+import pytest
+
+# own libraries
 from hct import *
 
 def test_full_cooling_system_workflow():
@@ -6,25 +14,96 @@ def test_full_cooling_system_workflow():
     constants = init_constants()
     geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5,
                         thickness_fin_t=1e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
-    geometry.fin_distance_s = calc_fin_distance_s(geometry)
     volume_flow_v_dot = 0.014
 
     r_th_sa = calc_final_r_th_s_a(geometry=geometry, constants=constants, t_ambient=25, volume_flow_v_dot=volume_flow_v_dot)
 
-    assert r_th_sa == 0.46442982872906496
+    assert r_th_sa == 0.46442982872906485
+
+def test_cooling_system_volume_flow_array():
+    """Check the vectorized r_th calculation against the scalar calculation."""
+    constants = init_constants()
+    geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5,
+                        thickness_fin_t=1e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+    volume_flow_v_dot_list = np.linspace(1e-3, 15e-3)
+
+    r_th_sa_list = calc_final_r_th_s_a(geometry=geometry, constants=constants, t_ambient=25, volume_flow_v_dot=volume_flow_v_dot_list)
+    r_th_sa_scalar_list = [calc_final_r_th_s_a(geometry=geometry, constants=constants, t_ambient=25, volume_flow_v_dot=volume_flow_v_dot)
+                           for volume_flow_v_dot in volume_flow_v_dot_list]
+
+    assert r_th_sa_list.shape == volume_flow_v_dot_list.shape
+    assert np.allclose(r_th_sa_list, r_th_sa_scalar_list, rtol=1e-12)
+
+def test_cooling_system_geometry_array():
+    """Integration test to check the cooling system calculation for several geometries at once."""
+    geometry_parameters = dict(length_l=[100e-3, 80e-3], width_b=[40e-3, 60e-3], height_d=[3e-3, 2e-3], height_c=[30e-3, 20e-3],
+                               number_fins_n=[5, 10], thickness_fin_t=[1e-3, 1.5e-3])
+    volume_flow_list = [3e-3, 4e-3]
+    constants = init_constants()
+
+    geometry_array = Geometry(**{key: np.array(value) for key, value in geometry_parameters.items()},
+                              fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+    r_th_sa_array = calc_final_r_th_s_a(geometry_array, constants, 40, np.array(volume_flow_list))
+
+    for count, volume_flow in enumerate(volume_flow_list):
+        geometry = Geometry(**{key: value[count] for key, value in geometry_parameters.items()},
+                            fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+        assert r_th_sa_array[count] == pytest.approx(calc_final_r_th_s_a(geometry, constants, 40, volume_flow), rel=1e-12)
 
 def test_full_hydrodynamic_workflow():
     """Integration test for the full hydrodynamic workflow."""
     geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5,
                         thickness_fin_t=1e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
-    geometry.fin_distance_s = calc_fin_distance_s(geometry)
 
     fan_name = 'orion_od4010m.csv'
 
     volume_flow, pressure = calc_volume_flow(fan_name, geometry, plot=False)
 
-    assert volume_flow == 0.002944221590149962
-    assert pressure == 6.463577383798171
+    assert volume_flow == 0.0029442215901499627
+    assert pressure == 6.4635773837981745
+
+def test_calc_volume_flow_no_intersection():
+    """Check that a geometry without an operating point gives nan, nan with and without a plot."""
+    from matplotlib import pyplot as plt
+    plt.switch_backend('Agg')
+
+    geometry = Geometry(length_l=42.9e-3, width_b=33e-3, height_d=3e-3, height_c=6.49e-3, number_fins_n=12,
+                        thickness_fin_t=2.37e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+
+    assert np.isnan(calc_volume_flow('orion_od4020h.csv', geometry)).all()
+    assert np.isnan(calc_volume_flow('orion_od4020h.csv', geometry, plot=True)).all()
+    plt.close('all')
+
+def test_calc_delta_p_total():
+    """Unit test to check the total pressure drop for a volume flow array."""
+    geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5,
+                        thickness_fin_t=1e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+
+    volume_flow, pressure = calc_volume_flow('orion_od4010m.csv', geometry, plot=False)
+    delta_p_total_list = calc_delta_p_total(geometry, CONSTANTS, np.array([0.5 * volume_flow, volume_flow]))
+
+    assert delta_p_total_list[0] < delta_p_total_list[1]
+    assert delta_p_total_list[1] == pytest.approx(pressure, rel=1e-2)
+
+def test_read_fan_data_cached():
+    """Unit test to check the cached fan curves."""
+    fan_cubic_meter_second, fan_pressure_drop_pascal = read_fan_data_cached('orion_od4010m.csv')
+    fan_cubic_meter_second_file, fan_pressure_drop_pascal_file = read_fan_data(os.path.join(FAN_DATA_DIRECTORY, "orion_od4010m.csv"))
+
+    assert read_fan_data_cached('orion_od4010m')[0] is fan_cubic_meter_second
+    assert (fan_cubic_meter_second == fan_cubic_meter_second_file).all()
+    assert (fan_pressure_drop_pascal == fan_pressure_drop_pascal_file).all()
+    assert not fan_pressure_drop_pascal.flags.writeable
+    # the fan files have no header, every line is a data point
+    with open(os.path.join(FAN_DATA_DIRECTORY, "orion_od4010m.csv")) as fan_file:
+        assert len(fan_cubic_meter_second) == len(fan_file.read().splitlines())
+
+def test_fan_list():
+    """Unit test to check the fan list of the fan-database."""
+    assert 'orion_od4010m.csv' in FAN_LIST
+    assert list(FAN_LIST) == sorted(FAN_LIST)
+    for fan_name in FAN_LIST:
+        assert fan_name.replace('.csv', '') in fan_database
 
 def test_calculate_intersection():
     """Unit test to check the intersection function."""
@@ -36,6 +115,17 @@ def test_calculate_intersection():
     assert (intersection_x == 0.5).all()
     assert (intersection_y == 0.5).all()
 
+    intersection_x, intersection_y = calc_intersection_point(
+        np.array([0.0, 1.0, 2.0]), np.array([0.0, 1.0, 2.0]), np.array([1.0, 0.0, -1.0]))
+    assert intersection_x == 0.5
+    assert intersection_y == 0.5
+
+    intersection_x, intersection_y = calc_intersection_point(np.array([0.0, 1.0]), np.array([0.0, 1.0]), np.array([2.0, 3.0]))
+    assert np.isnan(intersection_x)
+    assert np.isnan(intersection_y)
+    with pytest.raises(ValueError):
+        calculate_intersection(np.array([0.0, 1.0]), np.array([0.0, 1.0]), np.array([2.0, 3.0]))
+
 def test_heat_spreading_workflow():
     """Integration test to check the heat spreading workflow."""
     mosfet_area = 4.04e-3 * 6.44e-3
@@ -46,12 +136,16 @@ def test_heat_spreading_workflow():
 
     geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=thickness, height_c=30e-3, number_fins_n=5,
                         thickness_fin_t=1e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
-    geometry.fin_distance_s = calc_fin_distance_s(geometry)
 
     r_th_sp = calc_r_th_sp(spreading_material, r_th_zero)
 
     assert r_th_sp == 0.10359485058699519
 
+    spreading_material.thickness_d = np.array([0.2e-3, thickness])
+    r_th_sp_list = calc_r_th_sp(spreading_material, r_th_zero)
+
+    assert r_th_sp_list[1] == r_th_sp
+
 def test_calc_boxed_volume_heat_sink():
     """Unit test to calculate the boxed heat sink volume."""
     geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5,
@@ -70,6 +164,32 @@ def test_calc_fan_volume():
 
     assert fan_volume == volume_check
 
+def test_constants():
+    """Unit test to check the shared constants."""
+    assert CONSTANTS == init_constants()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        CONSTANTS.rho_air = 1.0
+
+def test_is_geometry_feasible():
+    """Unit test to check the geometry feasibility check."""
+    geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5,
+                        thickness_fin_t=1e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+    assert is_geometry_feasible(geometry, "orion_od4010l")
+
+    # overlapping fins
+    assert not is_geometry_feasible(dataclasses.replace(geometry, number_fins_n=40, fin_distance_s=0), "orion_od4010l")
+
+    # fan smaller than the heat sink
+    assert not is_geometry_feasible(dataclasses.replace(geometry, height_c=35e-3, fin_distance_s=0), "orion_od3010l.csv")
+
+    # heat sink higher than wide
+    assert not is_geometry_feasible(dataclasses.replace(geometry, height_c=50e-3, fin_distance_s=0), "orion_od6010l")
+
+    # array geometry, feasible only if all geometries are feasible
+    geometry_array = dataclasses.replace(geometry, number_fins_n=np.array([5, 10]), fin_distance_s=0)
+    assert is_geometry_feasible(geometry_array, "orion_od4010l")
+    assert not is_geometry_feasible(dataclasses.replace(geometry_array, number_fins_n=np.array([5, 40]), fin_distance_s=0), "orion_od4010l")
+
 def test_duct_volume_1():
     """Test the calculation of the duct volume."""
     fan_name = "orion_od4010l"
@@ -83,6 +203,48 @@ def test_duct_volume_1():
 
     assert 1.9232341936182356e-05 == duct_volume
 
+def test_geometry_fin_distance_s():
+    """Check that the fin distance is calculated on construction only if it is given as 0."""
+    geometry = Geometry(length_l=100e-3, width_b=40e-3, height_d=3e-3, height_c=30e-3, number_fins_n=5,
+                        thickness_fin_t=1e-3, fin_distance_s=0, alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+    assert geometry.fin_distance_s == pytest.approx((40e-3 - 6 * 1e-3) / 5)
+
+    geometry = dataclasses.replace(geometry, fin_distance_s=1e-3)
+    assert geometry.fin_distance_s == 1e-3
+
+    # array geometry mixing calculated and given fin distances
+    geometry = Geometry(length_l=100e-3, width_b=np.array([40e-3, 40e-3]), height_d=3e-3, height_c=30e-3, number_fins_n=5,
+                        thickness_fin_t=1e-3, fin_distance_s=np.array([0, 2e-3]), alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+    assert geometry.fin_distance_s[0] == pytest.approx((40e-3 - 6 * 1e-3) / 5)
+    assert geometry.fin_distance_s[1] == 2e-3
+
+def test_infeasible_geometry_array():
+    """Check that partly infeasible array inputs give nan only for the infeasible elements."""
+    geometry = Geometry(length_l=100e-3, width_b=np.array([40e-3, 40e-3, 20e-3, 60e-3]), height_d=3e-3,
+                        height_c=np.array([10e-3, 38e-3, 30e-3, 50e-3]), number_fins_n=5, thickness_fin_t=1e-3, fin_distance_s=0,
+                        alpha_rad=np.deg2rad(40), l_duct_min=5e-3)
+
+    # heat sink height larger than the width
+    l_duct = calc_l_duct(geometry)
+    assert l_duct[0] == pytest.approx(15e-3 / np.tan(np.deg2rad(40)))
+    assert l_duct[1] == 5e-3
+    assert np.isnan(l_duct[2])
+    assert not np.isnan(l_duct[3])
+
+    # heat sink cross-section larger than the 40 mm fan
+    duct_volume = calc_duct_volume(geometry, "orion_od4010l")
+    assert not np.isnan(duct_volume[:3]).any()
+    assert np.isnan(duct_volume[3])
+
+    # duct of the non-physical geometry is nan, so is its pressure drop
+    friction_factor_reynolds_product = calc_friction_factor_reynolds_product(
+        geometry, 3e-3, CONSTANTS, calc_friction_factor_reynolds_product_fd(calc_epsilon(geometry)))
+    f_app_duct = calc_f_app_duct(CONSTANTS, geometry, 3e-3, friction_factor_reynolds_product)
+    delta_p_total = calc_delta_p_total(geometry, CONSTANTS, 3e-3)
+    for count in range(4):
+        assert np.isnan(f_app_duct[count]) == (count == 2)
+        assert np.isnan(delta_p_total[count]) == (count == 2)
+
 # def test_duct_volume_2():
 #    fan_name  "orion_od4010l"
 #    geometry = Geometry(length_l=100e-3, width_b=50e-3, height_d=3e-3, height_c=50e-3, number_fins_n=5,